@@ -26,6 +26,7 @@ setup(
 
         #postgres db
         "asyncpg>=0.29.0",
+        "orjson>=3.9.0",                # JSONB 컬럼 직렬화
 
         # 리스크 분석 에이전트 의존성
         "yfinance>=0.2.28",                    # 야후 파이낸스 데이터
@@ -34,6 +35,7 @@ setup(
         "langgraph>=0.1.0",                    # 랭그래프
         "scipy>=1.11.0",                       # 상관관계 계산
         "scikit-learn>=1.3.0",                 # 머신러닝 유틸리티
+        "numba>=0.61.2",                       # 기술적 지표 루프 JIT 컴파일
     ],
     entry_points={
         "console_scripts": [
@@ -2,7 +2,6 @@
 분석 보고서 관련 데이터베이스 레포지토리
 """
 
-import json
 from typing import Optional, Dict, Any
 from asyncpg import Connection
 from src.app.analysis.models import AnalysisReportRequest, AnalysisReportData
@@ -39,11 +38,11 @@ class AnalysisRepository:
                 query,
                 request.user_idx,
                 request.market_regime,
-                json.dumps(request.used_regime_weights) if request.used_regime_weights else None,
-                json.dumps(request.quant_report) if request.quant_report else None,
-                json.dumps(request.social_report) if request.social_report else None,
-                json.dumps(request.risk_report) if request.risk_report else None,
-                json.dumps(request.analyst_summary) if request.analyst_summary else None
+                request.used_regime_weights or None,
+                request.quant_report or None,
+                request.social_report or None,
+                request.risk_report or None,
+                request.analyst_summary or None
             )
 
             self.logger.info(f"분석 보고서 저장 완료: analysis_report_idx={result}")
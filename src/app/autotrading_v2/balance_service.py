@@ -3,8 +3,9 @@
 바이낸스 API를 통해 현재 계좌의 실시간 잔고를 조회
 """
 
+import heapq
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
 from fastapi.concurrency import run_in_threadpool
 from src.app.user.service import UserService
@@ -20,6 +21,14 @@ from src.app.autotrading_v2.portfolio_utils import analyze_asset_with_fees
 logger = set_logger("balance_service_v2")
 
 
+def _split_fee(trade: Dict[str, Any]) -> Tuple[float, str]:
+    """거래의 fee 필드를 한 번만 조회해 (수수료, 수수료 자산)으로 분리"""
+    fee = trade.get('fee')
+    if isinstance(fee, dict):
+        return float(fee.get('cost') or 0), fee.get('currency') or 'USDT'
+    return float(fee or 0), 'USDT'
+
+
 class BalanceService:
     """잔고 조회 서비스 V2"""
 
@@ -139,6 +148,8 @@ class BalanceService:
             # 요청된 티커가 있으면 필터링, 없으면 모든 자산 조회
             target_assets = request.tickers if request.tickers else None
             logger.info(f"요청된 티커: {target_assets}")
+            # 자산별 포함 여부는 set으로 O(1) 조회
+            target_asset_set = set(target_assets) if target_assets else None
 
             # 바이낸스 API는 free, used, total 구조로 반환
             free_balance = account_info.get("free_balance", {})
@@ -148,6 +159,15 @@ class BalanceService:
             all_assets = set(free_balance.keys()) | set(used_balance.keys())
             logger.info(f"발견된 자산들: {list(all_assets)}")
 
+            # 가격이 필요한 자산의 시세를 한 번에 조회
+            priced_assets = [
+                asset for asset in all_assets
+                if asset != "USDT"
+                and float(free_balance.get(asset, 0)) + float(used_balance.get(asset, 0)) > 0
+                and (not target_asset_set or asset in target_asset_set)
+            ]
+            usdt_prices = await self._fetch_usdt_prices(binance_utils, priced_assets)
+
             for asset in all_assets:
                 free = float(free_balance.get(asset, 0))
                 locked = float(used_balance.get(asset, 0))
@@ -158,21 +178,16 @@ class BalanceService:
                     continue
 
                 # 특정 티커만 조회하는 경우 필터링
-                if target_assets and asset not in target_assets:
+                if target_asset_set and asset not in target_asset_set:
                     continue
 
                 # USDT가 아닌 자산의 경우 가격 조회
                 usdt_value = None
                 if asset != "USDT" and total > 0:
                     try:
-                        # 직접 CCXT를 사용해서 가격 조회
-                        import ccxt
-                        exchange = ccxt.binance({
-                            'sandbox': False,
-                            'enableRateLimit': True,
-                        })
-                        ticker = await run_in_threadpool(exchange.fetch_ticker, f"{asset}/USDT")
-                        price = float(ticker.get("last", 0))
+                        price = usdt_prices.get(asset)
+                        if price is None:
+                            raise ValueError(f"{asset}/USDT 시세 없음")
                         usdt_value = float(total) * price
                         total_usdt_value += usdt_value
                         logger.info(f"{asset} 가격: {price}, USDT 가치: {usdt_value}")
@@ -187,7 +202,7 @@ class BalanceService:
                 avg_entry_price = None
                 if asset == "BTC" and total > 0:
                     try:
-                        avg_entry_price = await self._get_avg_entry_price("BTC/USDT")
+                        avg_entry_price = await self._get_avg_entry_price(binance_utils, "BTC/USDT")
                         logger.info(f"BTC 평균 매수가격: {avg_entry_price}")
                     except Exception as e:
                         logger.warning(f"BTC 평균 매수가격 조회 실패: {str(e)}")
@@ -346,14 +361,34 @@ class BalanceService:
                 "error": str(e)
             }
 
-    async def _get_avg_entry_price(self, market: str) -> Optional[float]:
+    async def _fetch_usdt_prices(self, binance_utils: BinanceUtils, assets: List[str]) -> Dict[str, float]:
+        """자산들의 USDT 가격을 fetch_tickers 한 번으로 조회"""
+        if not assets:
+            return {}
+
+        try:
+            exchange = binance_utils.exchange
+            markets = await run_in_threadpool(exchange.load_markets)
+            symbols = [f"{asset}/USDT" for asset in assets if f"{asset}/USDT" in markets]
+            if not symbols:
+                return {}
+
+            tickers = await run_in_threadpool(exchange.fetch_tickers, symbols)
+            return {
+                symbol.split("/")[0]: float(ticker.get("last") or 0)
+                for symbol, ticker in tickers.items()
+            }
+        except Exception as e:
+            logger.warning(f"시세 일괄 조회 실패: {str(e)}")
+            return {}
+
+    async def _get_avg_entry_price(self, binance_utils: BinanceUtils, market: str) -> Optional[float]:
         """평균 매수가격 조회"""
         try:
             if not self.api_key or not self.secret:
                 logger.warning("바이낸스 API 키가 설정되지 않아 평균 매수가격을 조회할 수 없습니다")
                 return None
 
-            binance_utils = BinanceUtils(self.api_key, self.secret)
             avg_price = await binance_utils.calculate_avg_entry_price(market, limit=100)
             return avg_price
 
@@ -368,18 +403,12 @@ class BalanceService:
             all_trades = []
 
             try:
-                # CCXT를 직접 사용하여 거래 내역 조회
-                import ccxt
+                # 이미 생성된 바이낸스 인스턴스를 재사용하여 거래 내역 조회
                 if not self.api_key or not self.secret:
                     logger.error("API 키가 설정되지 않아 거래 내역을 조회할 수 없습니다")
                     return None, None, None
 
-                exchange = ccxt.binance({
-                    'apiKey': self.api_key,
-                    'secret': self.secret,
-                    'sandbox': False,
-                    'enableRateLimit': True,
-                })
+                exchange = binance_utils.exchange
                 # 최근 30일간의 거래 내역 조회
                 since = int((datetime.now(timezone.utc) - timedelta(days=30)).timestamp() * 1000)
 
@@ -413,13 +442,16 @@ class BalanceService:
                 logger.info("거래 내역이 없습니다.")
                 return None, None, None
 
-            # 시간순으로 정렬 (최신순)
-            all_trades.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
+            # 최신순 상위 N개만 추출 (전체 정렬 없이 O(N log k))
+            latest_trades = heapq.nlargest(
+                max(recent_trades_count, 1), all_trades, key=lambda x: x.get('timestamp', 0)
+            )
 
             # 마지막 거래 정보
             last_trade = None
-            if all_trades:
-                last_trade_data = all_trades[0]
+            if latest_trades:
+                last_trade_data = latest_trades[0]
+                fee, fee_asset = _split_fee(last_trade_data)
                 last_trade = LastTradeInfo(
                     date=datetime.fromtimestamp(last_trade_data.get('timestamp', 0) / 1000, tz=timezone.utc).isoformat(),
                     symbol=last_trade_data.get('symbol', ''),
@@ -427,13 +459,14 @@ class BalanceService:
                     amount=float(last_trade_data.get('amount', 0)),
                     price=float(last_trade_data.get('price', 0)),
                     cost=float(last_trade_data.get('cost', 0)),
-                    fee=float(last_trade_data.get('fee', {}).get('cost', 0)) if isinstance(last_trade_data.get('fee'), dict) else float(last_trade_data.get('fee', 0)),
-                    fee_asset=last_trade_data.get('fee', {}).get('currency', 'USDT') if isinstance(last_trade_data.get('fee'), dict) else 'USDT'
+                    fee=fee,
+                    fee_asset=fee_asset
                 )
 
             # 최근 거래 내역
             recent_trades = []
-            for trade_data in all_trades[:recent_trades_count]:
+            for trade_data in latest_trades[:recent_trades_count]:
+                fee, fee_asset = _split_fee(trade_data)
                 recent_trades.append(RecentTradeInfo(
                     date=datetime.fromtimestamp(trade_data.get('timestamp', 0) / 1000, tz=timezone.utc).isoformat(),
                     symbol=trade_data.get('symbol', ''),
@@ -441,8 +474,8 @@ class BalanceService:
                     amount=float(trade_data.get('amount', 0)),
                     price=float(trade_data.get('price', 0)),
                     cost=float(trade_data.get('cost', 0)),
-                    fee=float(trade_data.get('fee', {}).get('cost', 0)) if isinstance(trade_data.get('fee'), dict) else float(trade_data.get('fee', 0)),
-                    fee_asset=trade_data.get('fee', {}).get('currency', 'USDT') if isinstance(trade_data.get('fee'), dict) else 'USDT'
+                    fee=fee,
+                    fee_asset=fee_asset
                 ))
 
             # AI 분석 데이터 생성
@@ -472,26 +505,43 @@ class BalanceService:
                     fee_efficiency=0.0
                 )
 
-            # 기본 통계
+            # 기본 통계 (거래 목록을 한 번만 순회하며 누적)
             total_trades = len(trades)
-            buy_trades = [t for t in trades if t.get('side') == 'buy']
-            sell_trades = [t for t in trades if t.get('side') == 'sell']
-
-            buy_count = len(buy_trades)
-            sell_count = len(sell_trades)
+            # 거래 빈도 기준 시각을 한 번만 ms 타임스탬프로 계산하고 거래별 datetime 변환 없이 비교
+            thirty_days_ago_ms = (datetime.now(timezone.utc) - timedelta(days=30)).timestamp() * 1000
+
+            buy_count = 0
+            sell_count = 0
+            total_amount = 0.0
+            total_quantity = 0.0
+            total_fees = 0.0
+            recent_trades_count = 0
+            first_timestamp = None
+            last_timestamp = None
+            for t in trades:
+                side = t.get('side')
+                if side == 'buy':
+                    buy_count += 1
+                elif side == 'sell':
+                    sell_count += 1
+
+                total_amount += float(t.get('cost', 0))
+                total_quantity += float(t.get('amount', 0))
+                total_fees += _split_fee(t)[0]
+
+                timestamp = t.get('timestamp', 0)
+                if timestamp >= thirty_days_ago_ms:
+                    recent_trades_count += 1
+                if first_timestamp is None or timestamp < first_timestamp:
+                    first_timestamp = timestamp
+                if last_timestamp is None or timestamp > last_timestamp:
+                    last_timestamp = timestamp
 
             # 거래 금액 및 수량 통계
-            total_amount = sum(float(t.get('cost', 0)) for t in trades)
-            total_quantity = sum(float(t.get('amount', 0)) for t in trades)
             avg_trade_amount = total_amount / total_trades if total_trades > 0 else 0.0
             avg_trade_quantity = total_quantity / total_trades if total_trades > 0 else 0.0
 
             # 수수료 통계
-            total_fees = sum(
-                float(t.get('fee', {}).get('cost', 0)) if isinstance(t.get('fee'), dict)
-                else float(t.get('fee', 0))
-                for t in trades
-            )
             fee_efficiency = (total_fees / total_amount) * 100 if total_amount > 0 else 0.0
 
             # 매수/매도 비율 (inf 값 방지)
@@ -503,16 +553,11 @@ class BalanceService:
                 buy_sell_ratio = 0.0
 
             # 거래 빈도 계산 (최근 30일 기준)
-            now = datetime.now(timezone.utc)
-            thirty_days_ago = now - timedelta(days=30)
-            recent_trades = [t for t in trades if datetime.fromtimestamp(t.get('timestamp', 0) / 1000, tz=timezone.utc) >= thirty_days_ago]
-            trading_frequency = len(recent_trades) / 30.0  # 거래/일
-
-            # 거래 간격 계산
-            if len(trades) > 1:
-                timestamps = sorted([t.get('timestamp', 0) for t in trades])
-                intervals = [(timestamps[i+1] - timestamps[i]) / (1000 * 3600) for i in range(len(timestamps)-1)]  # 시간 단위
-                avg_trade_interval_hours = sum(intervals) / len(intervals) if intervals else 0.0
+            trading_frequency = recent_trades_count / 30.0  # 거래/일
+
+            # 거래 간격 계산: 정렬된 연속 간격의 평균은 (최대 - 최소) / (N - 1)과 같으므로 정렬 불필요
+            if total_trades > 1:
+                avg_trade_interval_hours = (last_timestamp - first_timestamp) / (1000 * 3600) / (total_trades - 1)  # 시간 단위
             else:
                 avg_trade_interval_hours = 0.0
 
@@ -17,6 +17,17 @@ from src.common.utils.logger import set_logger
 
 logger = set_logger("offchain_router_v2")
 
+# 서비스 인스턴스 (소셜 API 클라이언트 초기화 비용을 요청마다 반복하지 않도록 재사용)
+offchain_service = None  # 지연 초기화
+
+
+def get_offchain_service():
+    """오프체인 분석 서비스 지연 초기화"""
+    global offchain_service
+    if offchain_service is None:
+        offchain_service = OffchainServiceV2()
+    return offchain_service
+
 # 오프체인 전용 라우터 생성
 router = APIRouter(
     prefix="/offchain",
@@ -44,12 +55,12 @@ async def analyze_offchain_simple(
     try:
         logger.info(f"🔍 [오프체인] GET 요청: {market} | {timeframe} | {count}개")
 
-        async with OffchainServiceV2() as service:
-            result = await service.analyze_offchain_sentiment(
-                market=market,
-                timeframe=timeframe,
-                count=count
-            )
+        service = get_offchain_service()
+        result = await service.analyze_offchain_sentiment(
+            market=market,
+            timeframe=timeframe,
+            count=count
+        )
 
         return result
 
@@ -70,12 +81,12 @@ async def analyze_offchain_detailed(
         logger.info(f"🔍 [오프체인] POST 요청: {request.market} | {request.timeframe} | {request.count}개")
         logger.info(f"📊 포함 옵션: 뉴스={request.include_news}, 소셜={request.include_social}, 거시경제={request.include_macro}")
 
-        async with OffchainServiceV2() as service:
-            result = await service.analyze_offchain_sentiment(
-                market=request.market,
-                timeframe=request.timeframe,
-                count=request.count
-            )
+        service = get_offchain_service()
+        result = await service.analyze_offchain_sentiment(
+            market=request.market,
+            timeframe=request.timeframe,
+            count=request.count
+        )
 
         return result
 
@@ -97,35 +108,37 @@ async def analyze_news_sentiment(
     try:
         logger.info(f"📰 [뉴스] 분석 요청: {market} | {timeframe} | {count}개")
 
-        async with OffchainServiceV2() as service:
-            result = await service.analyze_offchain_sentiment(
-                market=market,
-                timeframe=timeframe,
-                count=count
-            )
+        service = get_offchain_service()
+        result = await service.analyze_offchain_sentiment(
+            market=market,
+            timeframe=timeframe,
+            count=count
+        )
 
-            # 뉴스 분석만 추출
-            news_analysis = result.get('analysis', {}).get('news_analysis', {})
-            detailed_news = result.get('detailed_data', {}).get('news_analysis', {})
-
-            return {
-                "status": "success",
-                "market": market,
-                "timeframe": timeframe,
-                "timestamp": datetime.now().isoformat(),
-                "analysis": {
-                    "news_sentiment": news_analysis,
-                    "overall_sentiment": result.get('analysis', {}).get('overall_sentiment', {})
-                },
-                "detailed_data": {
-                    "news_analysis": detailed_news,
-                    "offchain_score": result.get('detailed_data', {}).get('offchain_score', 0.0)
-                },
-                "metadata": {
-                    "analysis_type": "news_only",
-                    "version": "v2"
-                }
+        # 뉴스 분석만 추출
+        analysis = result.get('analysis') or {}
+        detailed_data = result.get('detailed_data') or {}
+        news_analysis = analysis.get('news_analysis', {})
+        detailed_news = detailed_data.get('news_analysis', {})
+
+        return {
+            "status": "success",
+            "market": market,
+            "timeframe": timeframe,
+            "timestamp": datetime.now().isoformat(),
+            "analysis": {
+                "news_sentiment": news_analysis,
+                "overall_sentiment": analysis.get('overall_sentiment', {})
+            },
+            "detailed_data": {
+                "news_analysis": detailed_news,
+                "offchain_score": detailed_data.get('offchain_score', 0.0)
+            },
+            "metadata": {
+                "analysis_type": "news_only",
+                "version": "v2"
             }
+        }
 
     except Exception as e:
         logger.error(f"뉴스 분석 실패: {str(e)}")
@@ -145,35 +158,37 @@ async def analyze_social_sentiment(
     try:
         logger.info(f"📱 [소셜] 분석 요청: {market} | {timeframe} | {count}개")
 
-        async with OffchainServiceV2() as service:
-            result = await service.analyze_offchain_sentiment(
-                market=market,
-                timeframe=timeframe,
-                count=count
-            )
+        service = get_offchain_service()
+        result = await service.analyze_offchain_sentiment(
+            market=market,
+            timeframe=timeframe,
+            count=count
+        )
 
-            # 소셜 분석만 추출
-            social_analysis = result.get('analysis', {}).get('social_analysis', {})
-            detailed_social = result.get('detailed_data', {}).get('social_analysis', {})
-
-            return {
-                "status": "success",
-                "market": market,
-                "timeframe": timeframe,
-                "timestamp": datetime.now().isoformat(),
-                "analysis": {
-                    "social_sentiment": social_analysis,
-                    "overall_sentiment": result.get('analysis', {}).get('overall_sentiment', {})
-                },
-                "detailed_data": {
-                    "social_analysis": detailed_social,
-                    "offchain_score": result.get('detailed_data', {}).get('offchain_score', 0.0)
-                },
-                "metadata": {
-                    "analysis_type": "social_only",
-                    "version": "v2"
-                }
+        # 소셜 분석만 추출
+        analysis = result.get('analysis') or {}
+        detailed_data = result.get('detailed_data') or {}
+        social_analysis = analysis.get('social_analysis', {})
+        detailed_social = detailed_data.get('social_analysis', {})
+
+        return {
+            "status": "success",
+            "market": market,
+            "timeframe": timeframe,
+            "timestamp": datetime.now().isoformat(),
+            "analysis": {
+                "social_sentiment": social_analysis,
+                "overall_sentiment": analysis.get('overall_sentiment', {})
+            },
+            "detailed_data": {
+                "social_analysis": detailed_social,
+                "offchain_score": detailed_data.get('offchain_score', 0.0)
+            },
+            "metadata": {
+                "analysis_type": "social_only",
+                "version": "v2"
             }
+        }
 
     except Exception as e:
         logger.error(f"소셜 분석 실패: {str(e)}")
@@ -193,35 +208,37 @@ async def analyze_macro_indicators(
     try:
         logger.info(f"📈 [거시경제] 분석 요청: {market} | {timeframe} | {count}개")
 
-        async with OffchainServiceV2() as service:
-            result = await service.analyze_offchain_sentiment(
-                market=market,
-                timeframe=timeframe,
-                count=count
-            )
+        service = get_offchain_service()
+        result = await service.analyze_offchain_sentiment(
+            market=market,
+            timeframe=timeframe,
+            count=count
+        )
 
-            # 거시경제 분석만 추출
-            macro_analysis = result.get('analysis', {}).get('macro_analysis', {})
-            detailed_macro = result.get('detailed_data', {}).get('macro_analysis', {})
-
-            return {
-                "status": "success",
-                "market": market,
-                "timeframe": timeframe,
-                "timestamp": datetime.now().isoformat(),
-                "analysis": {
-                    "macro_impact": macro_analysis,
-                    "overall_sentiment": result.get('analysis', {}).get('overall_sentiment', {})
-                },
-                "detailed_data": {
-                    "macro_analysis": detailed_macro,
-                    "offchain_score": result.get('detailed_data', {}).get('offchain_score', 0.0)
-                },
-                "metadata": {
-                    "analysis_type": "macro_only",
-                    "version": "v2"
-                }
+        # 거시경제 분석만 추출
+        analysis = result.get('analysis') or {}
+        detailed_data = result.get('detailed_data') or {}
+        macro_analysis = analysis.get('macro_analysis', {})
+        detailed_macro = detailed_data.get('macro_analysis', {})
+
+        return {
+            "status": "success",
+            "market": market,
+            "timeframe": timeframe,
+            "timestamp": datetime.now().isoformat(),
+            "analysis": {
+                "macro_impact": macro_analysis,
+                "overall_sentiment": analysis.get('overall_sentiment', {})
+            },
+            "detailed_data": {
+                "macro_analysis": detailed_macro,
+                "offchain_score": detailed_data.get('offchain_score', 0.0)
+            },
+            "metadata": {
+                "analysis_type": "macro_only",
+                "version": "v2"
             }
+        }
 
     except Exception as e:
         logger.error(f"거시경제 분석 실패: {str(e)}")
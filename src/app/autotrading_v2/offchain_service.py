@@ -8,6 +8,8 @@ import asyncio
 import aiohttp
 import json
 import os
+import traceback
+from bisect import bisect_right
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import numpy as np
@@ -21,6 +23,18 @@ from .models import OffchainRequest, OffchainResponse
 
 logger = set_logger("offchain_service_v2")
 
+# 센티멘트 점수 해석 구간 (오름차순 하한값, 라벨은 구간 순서대로)
+SENTIMENT_THRESHOLDS = (-0.6, -0.3, -0.1, 0.1, 0.3, 0.6)
+SENTIMENT_INTERPRETATIONS = (
+    "매우 강한 부정적 신호",
+    "강한 부정적 신호",
+    "약한 부정적 신호",
+    "중립적 신호",
+    "약한 긍정적 신호",
+    "강한 긍정적 신호",
+    "매우 강한 긍정적 신호",
+)
+
 class OffchainServiceV2:
     """오프체인 분석 서비스 V2"""
 
@@ -83,29 +97,31 @@ class OffchainServiceV2:
             logger.info("🚀 [2단계] 오프체인 센티멘트 분석 시작")
             logger.info(f"📊 {market} | {timeframe} | {count}개 캔들")
 
-            # 1. 뉴스 데이터 수집
-            try:
-                news_items = await self._collect_news_data()
-                logger.info(f"✅ 뉴스 데이터: {len(news_items)}개")
-            except Exception as e:
-                logger.warning(f"뉴스 데이터 수집 실패: {str(e)}")
+            # 1~3. 뉴스 / 소셜미디어 / 거시경제 데이터 동시 수집 (서로 독립적인 I/O)
+            news_items, social_data, macro_data = await asyncio.gather(
+                self._collect_news_data(),
+                self._collect_social_data(),
+                self._collect_macro_data(),
+                return_exceptions=True
+            )
+
+            if isinstance(news_items, Exception):
+                logger.warning(f"뉴스 데이터 수집 실패: {str(news_items)}")
                 news_items = []
+            else:
+                logger.info(f"✅ 뉴스 데이터: {len(news_items)}개")
 
-            # 2. 소셜미디어 데이터 수집
-            try:
-                social_data = await self._collect_social_data()
-                logger.info(f"✅ 소셜미디어 데이터: {len(social_data)}개")
-            except Exception as e:
-                logger.warning(f"소셜미디어 데이터 수집 실패: {str(e)}")
+            if isinstance(social_data, Exception):
+                logger.warning(f"소셜미디어 데이터 수집 실패: {str(social_data)}")
                 social_data = []
+            else:
+                logger.info(f"✅ 소셜미디어 데이터: {len(social_data)}개")
 
-            # 3. 거시경제 데이터 수집
-            try:
-                macro_data = await self._collect_macro_data()
-                logger.info(f"✅ 거시경제 데이터: {len(macro_data)}개")
-            except Exception as e:
-                logger.warning(f"거시경제 데이터 수집 실패: {str(e)}")
+            if isinstance(macro_data, Exception):
+                logger.warning(f"거시경제 데이터 수집 실패: {str(macro_data)}")
                 macro_data = []
+            else:
+                logger.info(f"✅ 거시경제 데이터: {len(macro_data)}개")
 
             # 4. 통합 분석
             try:
@@ -142,7 +158,6 @@ class OffchainServiceV2:
 
         except Exception as e:
             logger.error(f"오프체인 센티멘트 분석 실패: {str(e)}")
-            import traceback
             traceback.print_exc()
             return self._create_error_response(market, timeframe, str(e))
 
@@ -152,11 +167,12 @@ class OffchainServiceV2:
             # 실제 구현에서는 NewsAPI, GDELT, RSS 피드 등을 사용
             # 현재는 모의 데이터로 구현
 
+            now = datetime.now()
             mock_news = [
                 NewsItem(
                     title="Bitcoin ETF Approval Expected This Week",
                     source="Reuters",
-                    published_at=datetime.now() - timedelta(hours=2),
+                    published_at=now - timedelta(hours=2),
                     sentiment_score=0.7,
                     relevance_score=0.9,
                     url="https://reuters.com/bitcoin-etf"
@@ -164,7 +180,7 @@ class OffchainServiceV2:
                 NewsItem(
                     title="Crypto Regulation Concerns Rise in Europe",
                     source="Bloomberg",
-                    published_at=datetime.now() - timedelta(hours=4),
+                    published_at=now - timedelta(hours=4),
                     sentiment_score=-0.3,
                     relevance_score=0.8,
                     url="https://bloomberg.com/crypto-regulation"
@@ -172,7 +188,7 @@ class OffchainServiceV2:
                 NewsItem(
                     title="Major Bank Announces Bitcoin Custody Services",
                     source="WSJ",
-                    published_at=datetime.now() - timedelta(hours=6),
+                    published_at=now - timedelta(hours=6),
                     sentiment_score=0.5,
                     relevance_score=0.7,
                     url="https://wsj.com/bitcoin-custody"
@@ -180,7 +196,7 @@ class OffchainServiceV2:
                 NewsItem(
                     title="Bitcoin Mining Difficulty Reaches New High",
                     source="CoinDesk",
-                    published_at=datetime.now() - timedelta(hours=8),
+                    published_at=now - timedelta(hours=8),
                     sentiment_score=0.2,
                     relevance_score=0.6,
                     url="https://coindesk.com/mining-difficulty"
@@ -195,6 +211,7 @@ class OffchainServiceV2:
 
     async def _collect_social_data(self) -> List[SocialSentiment]:
         """소셜미디어 데이터 수집 (실제 Reddit & Twitter API)"""
+        now = datetime.now()
         try:
             # 실제 Reddit과 Twitter API를 통한 데이터 수집
             social_mentions = await self.social_aggregator.collect_social_mentions(
@@ -207,8 +224,13 @@ class OffchainServiceV2:
             social_data = []
 
             # 플랫폼별로 그룹화
-            reddit_mentions = [m for m in social_mentions if m.platform == 'reddit']
-            twitter_mentions = [m for m in social_mentions if m.platform == 'twitter']
+            reddit_mentions = []
+            twitter_mentions = []
+            for mention in social_mentions:
+                if mention.platform == 'reddit':
+                    reddit_mentions.append(mention)
+                elif mention.platform == 'twitter':
+                    twitter_mentions.append(mention)
 
             # Reddit 데이터 처리
             if reddit_mentions:
@@ -219,7 +241,7 @@ class OffchainServiceV2:
                         mention_count=reddit_analysis['mention_count'],
                         sentiment_score=reddit_analysis['sentiment_score'],
                         trend_score=reddit_analysis['trend_score'],
-                        timestamp=datetime.now() - timedelta(hours=1)
+                        timestamp=now - timedelta(hours=1)
                     ))
                 except Exception as e:
                     logger.warning(f"Reddit 분석 실패: {str(e)}")
@@ -233,7 +255,7 @@ class OffchainServiceV2:
                         mention_count=twitter_analysis['mention_count'],
                         sentiment_score=twitter_analysis['sentiment_score'],
                         trend_score=twitter_analysis['trend_score'],
-                        timestamp=datetime.now() - timedelta(hours=1)
+                        timestamp=now - timedelta(hours=1)
                     ))
                 except Exception as e:
                     logger.warning(f"Twitter 분석 실패: {str(e)}")
@@ -247,14 +269,14 @@ class OffchainServiceV2:
                         mention_count=890,
                         sentiment_score=0.2,
                         trend_score=0.4,
-                        timestamp=datetime.now() - timedelta(hours=2)
+                        timestamp=now - timedelta(hours=2)
                     ),
                     SocialSentiment(
                         platform="twitter",
                         mention_count=1250,
                         sentiment_score=0.4,
                         trend_score=0.6,
-                        timestamp=datetime.now() - timedelta(hours=1)
+                        timestamp=now - timedelta(hours=1)
                     )
                 ]
 
@@ -269,14 +291,14 @@ class OffchainServiceV2:
                     mention_count=890,
                     sentiment_score=0.2,
                     trend_score=0.4,
-                    timestamp=datetime.now() - timedelta(hours=2)
+                    timestamp=now - timedelta(hours=2)
                 ),
                 SocialSentiment(
                     platform="twitter",
                     mention_count=1250,
                     sentiment_score=0.4,
                     trend_score=0.6,
-                    timestamp=datetime.now() - timedelta(hours=1)
+                    timestamp=now - timedelta(hours=1)
                 )
             ]
 
@@ -286,6 +308,7 @@ class OffchainServiceV2:
             # 실제 구현에서는 FRED API, Yahoo Finance, Investing.com 등을 사용
             # 현재는 모의 데이터로 구현
 
+            now = datetime.now()
             mock_macro = [
                 MacroIndicator(
                     indicator="cpi",
@@ -293,7 +316,7 @@ class OffchainServiceV2:
                     previous_value=3.1,
                     change_pct=0.1,
                     impact_score=0.2,
-                    timestamp=datetime.now() - timedelta(days=1)
+                    timestamp=now - timedelta(days=1)
                 ),
                 MacroIndicator(
                     indicator="interest_rate",
@@ -301,7 +324,7 @@ class OffchainServiceV2:
                     previous_value=5.0,
                     change_pct=0.25,
                     impact_score=-0.3,
-                    timestamp=datetime.now() - timedelta(days=2)
+                    timestamp=now - timedelta(days=2)
                 ),
                 MacroIndicator(
                     indicator="dxy",
@@ -309,7 +332,7 @@ class OffchainServiceV2:
                     previous_value=104.2,
                     change_pct=-0.7,
                     impact_score=0.1,
-                    timestamp=datetime.now() - timedelta(days=3)
+                    timestamp=now - timedelta(days=3)
                 ),
                 MacroIndicator(
                     indicator="unemployment",
@@ -317,7 +340,7 @@ class OffchainServiceV2:
                     previous_value=3.9,
                     change_pct=-0.1,
                     impact_score=0.1,
-                    timestamp=datetime.now() - timedelta(days=4)
+                    timestamp=now - timedelta(days=4)
                 )
             ]
 
@@ -399,20 +422,10 @@ class OffchainServiceV2:
 
     def _get_sentiment_interpretation(self, score: float) -> str:
         """센티멘트 점수 해석"""
-        if score >= 0.6:
-            return "매우 강한 긍정적 신호"
-        elif score >= 0.3:
-            return "강한 긍정적 신호"
-        elif score >= 0.1:
-            return "약한 긍정적 신호"
-        elif score >= -0.1:
-            return "중립적 신호"
-        elif score >= -0.3:
-            return "약한 부정적 신호"
-        elif score >= -0.6:
-            return "강한 부정적 신호"
-        else:
-            return "매우 강한 부정적 신호"
+        # NaN은 어떤 하한값도 넘지 않은 것으로 처리 (기존 if/elif 체인과 동일)
+        if score != score:
+            return SENTIMENT_INTERPRETATIONS[0]
+        return SENTIMENT_INTERPRETATIONS[bisect_right(SENTIMENT_THRESHOLDS, score)]
 
     def _create_error_response(self, market: str, timeframe: str, error_msg: str) -> Dict[str, Any]:
         """에러 응답 생성"""
@@ -4,10 +4,13 @@ TA-Lib 기반 고성능 기술적 분석 서비스
 """
 
 import asyncio
+import time
+import ccxt
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
+from fastapi.concurrency import run_in_threadpool
 
 from src.common.utils.bitcoin.exchange_interface import ExchangeFactory
 from src.common.utils.technical_indicators_v2 import TechnicalIndicatorsV2, RegimeDetectorV2, ScoreCalculatorV2
@@ -16,6 +19,15 @@ from src.app.autotrading_v2.models import QuantitativeRequest, QuantitativeRespo
 
 logger = set_logger("quantitative_v2")
 
+# 바이낸스 마켓 정보 재로딩 주기 (초)
+MARKETS_TTL_SECONDS = 3600
+
+# 요청 시간프레임 -> ccxt 시간프레임
+TIMEFRAME_MAP = {
+    "minutes:1": "1m", "minutes:5": "5m", "minutes:15": "15m",
+    "minutes:30": "30m", "minutes:60": "1h", "minutes:240": "4h", "days": "1d"
+}
+
 
 class QuantitativeServiceV2:
     """정량지표 분석 서비스 V2"""
@@ -26,6 +38,15 @@ class QuantitativeServiceV2:
         self.regime_detector = RegimeDetectorV2()
         self.score_calculator = ScoreCalculatorV2()
 
+        # 바이낸스 공개 API 인스턴스 (요청마다 생성/마켓 로딩하지 않도록 재사용)
+        self.public_exchange = ccxt.binance({
+            'sandbox': False,  # 메인넷 사용
+            'enableRateLimit': True,
+        })
+        self._markets_loaded_at = float("-inf")
+        # 동기 ccxt 인스턴스는 스레드 안전하지 않으므로 마켓 갱신/조회를 직렬화
+        self._exchange_lock = asyncio.Lock()
+
         # 지표 설정
         self.indicator_config = {
             'adx_period': 14,
@@ -178,6 +199,20 @@ class QuantitativeServiceV2:
                 "metadata": {"error": str(e)}
             }
 
+    async def _get_public_exchange(self) -> ccxt.binance:
+        """공개 API용 바이낸스 인스턴스 반환 (마켓 정보는 TTL 동안 재사용, _exchange_lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        if now - self._markets_loaded_at >= MARKETS_TTL_SECONDS:
+            try:
+                await run_in_threadpool(self.public_exchange.load_markets, True)
+                self._markets_loaded_at = now
+            except Exception as e:
+                # 한 번도 로딩하지 못했다면 조회할 수 없으므로 그대로 실패
+                if self._markets_loaded_at == float("-inf"):
+                    raise
+                logger.warning(f"마켓 정보 갱신 실패, 기존 마켓 정보 사용: {str(e)}")
+        return self.public_exchange
+
     async def _get_ohlcv_data(
         self,
         market: str,
@@ -187,27 +222,19 @@ class QuantitativeServiceV2:
     ) -> Optional[pd.DataFrame]:
         """OHLCV 데이터 수집"""
         try:
-            # 공개 API로 OHLCV 데이터 조회 (ccxt 직접 사용)
-            import ccxt
-
-            # 바이낸스 거래소 인스턴스 생성 (공개 API만 사용)
-            exchange_instance = ccxt.binance({
-                'sandbox': False,  # 메인넷 사용
-                'enableRateLimit': True,
-            })
-
+            # 공개 API로 OHLCV 데이터 조회 (서비스 단위로 재사용하는 ccxt 인스턴스)
             # 시간프레임 변환
-            timeframe_map = {
-                "minutes:1": "1m", "minutes:5": "5m", "minutes:15": "15m",
-                "minutes:30": "30m", "minutes:60": "1h", "minutes:240": "4h", "days": "1d"
-            }
-            ccxt_timeframe = timeframe_map.get(timeframe, "1h")
+            ccxt_timeframe = TIMEFRAME_MAP.get(timeframe, "1h")
 
             # OHLCV 데이터 가져오기
-            ohlcv_data = exchange_instance.fetch_ohlcv(market, ccxt_timeframe, limit=count)
+            # 동기 ccxt 호출이 이벤트 루프를 막지 않도록 스레드풀에서 실행
+            async with self._exchange_lock:
+                exchange_instance = await self._get_public_exchange()
+                ohlcv_data = await run_in_threadpool(
+                    exchange_instance.fetch_ohlcv, market, ccxt_timeframe, limit=count
+                )
 
             # pandas DataFrame으로 변환
-            import pandas as pd
             ohlcv_df = pd.DataFrame(ohlcv_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
             ohlcv_df['timestamp'] = pd.to_datetime(ohlcv_df['timestamp'], unit='ms')
             ohlcv_df.set_index('timestamp', inplace=True)
@@ -1,6 +1,31 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import json
+
+# 거래 실행마다 사용하는 INSERT 문 (동일한 SQL 텍스트로 커넥션별 prepared statement 캐시 재사용)
+INSERT_TRADE_SQL = """
+    INSERT INTO trades (
+        cycle_idx, timestamp, market, action, quantity, price,
+        value_usdt, fee_usdt, exchange_order_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    RETURNING idx
+"""
+
+INSERT_TRADING_CYCLE_SQL = """
+    INSERT INTO trading_cycles (
+        user_idx, analysis_report_idx, used_strategy_weights, prime_agent_decision
+    )
+    VALUES ($1, $2, $3, $4)
+    RETURNING idx
+"""
+
+INSERT_PORTFOLIO_SNAPSHOT_SQL = """
+    INSERT INTO portfolio_snapshots (
+        cycle_idx, total_value_usdt, asset_balances
+    )
+    VALUES ($1, $2, $3)
+    RETURNING idx
+"""
 
 
 class TradingRepository:
@@ -24,17 +49,8 @@ class TradingRepository:
         """
         거래 실행 데이터를 trades 테이블에 저장
         """
-        query = """
-            INSERT INTO trades (
-                cycle_idx, timestamp, market, action, quantity, price,
-                value_usdt, fee_usdt, exchange_order_id
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            RETURNING idx
-        """
-
         return await session.fetchval(
-            query,
+            INSERT_TRADE_SQL,
             cycle_idx, timestamp, market, action, quantity, price,
             value_usdt, fee_usdt, exchange_order_id
         )
@@ -50,21 +66,11 @@ class TradingRepository:
         """
         거래 사이클 생성
         """
-        query = """
-            INSERT INTO trading_cycles (
-                user_idx, analysis_report_idx, used_strategy_weights, prime_agent_decision
-            )
-            VALUES ($1, $2, $3, $4)
-            RETURNING idx
-        """
-
-        # JSON 데이터를 문자열로 변환
-        weights_json = json.dumps(used_strategy_weights) if used_strategy_weights else None
-        decision_json = json.dumps(prime_agent_decision) if prime_agent_decision else None
-
+        # jsonb 컬럼은 커넥션 코덱이 dict를 직접 인코딩
         return await session.fetchval(
-            query,
-            user_idx, analysis_report_idx, weights_json, decision_json
+            INSERT_TRADING_CYCLE_SQL,
+            user_idx, analysis_report_idx,
+            used_strategy_weights or None, prime_agent_decision or None
         )
 
     async def create_portfolio_snapshot(
@@ -77,19 +83,9 @@ class TradingRepository:
         """
         포트폴리오 스냅샷 생성
         """
-        query = """
-            INSERT INTO portfolio_snapshots (
-                cycle_idx, total_value_usdt, asset_balances
-            )
-            VALUES ($1, $2, $3)
-            RETURNING idx
-        """
-
-        balances_json = json.dumps(asset_balances) if asset_balances else None
-
         return await session.fetchval(
-            query,
-            cycle_idx, total_value_usdt, balances_json
+            INSERT_PORTFOLIO_SNAPSHOT_SQL,
+            cycle_idx, total_value_usdt, asset_balances or None
         )
 
     async def get_trades_by_user(
@@ -4,6 +4,9 @@ yfinance, LangChain, LangGraph를 활용한 시장 리스크 분석
 """
 
 import asyncio
+import time
+import traceback
+from bisect import bisect_right
 import numpy as np
 
 import pandas as pd
@@ -32,6 +35,14 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     StandardScaler = None
 
+try:
+    from langchain_core.messages import HumanMessage, SystemMessage
+    LANGCHAIN_MESSAGES_AVAILABLE = True
+except ImportError:
+    LANGCHAIN_MESSAGES_AVAILABLE = False
+    HumanMessage = None
+    SystemMessage = None
+
 from src.common.utils.logger import set_logger
 from src.app.autotrading_v2.risk_models import (
     RiskAnalysisRequest, RiskAnalysisResponse,
@@ -41,6 +52,24 @@ from src.app.autotrading_v2.risk_models import (
 
 logger = set_logger("risk_analysis")
 
+# 투자 성향별 리스크 단계 임계값 (MEDIUM, HIGH, CRITICAL 순서)
+# 보수적: 더 민감하게 리스크 감지 / 공격적: 덜 민감하게 리스크 감지
+RISK_LEVEL_THRESHOLDS = {
+    "conservative": {"score": (30, 50, 70), "vix": (15, 20, 30)},
+    "neutral": {"score": (40, 60, 80), "vix": (20, 25, 35)},
+    "aggressive": {"score": (50, 70, 90), "vix": (25, 30, 40)},
+}
+RISK_OFF_COUNT_THRESHOLDS = (1, 2, 3)
+RISK_LEVEL_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+RISK_LEVEL_CONFIDENCE = (0.6, 0.7, 0.8, 0.9)
+
+
+def _threshold_step(bounds: Tuple[float, ...], value: float) -> int:
+    """값이 넘어선 임계값 개수 (NaN은 어떤 임계값도 넘지 않은 것으로 처리)"""
+    if value != value:
+        return 0
+    return bisect_right(bounds, value)
+
 
 class RiskAnalysisService:
     """리스크 분석 서비스"""
@@ -55,11 +84,14 @@ class RiskAnalysisService:
             'gold': 'GC=F'
         }
 
+        # 일봉 기반 시장 데이터 캐시 (키: (조회 기간, 분석 타입), 값: (저장 시각, MarketData))
+        self.market_data_ttl = 300
+        self._market_data_cache: Dict[Tuple[int, str], Tuple[float, MarketData]] = {}
+
         # AI 분석을 위한 LangChain 설정
         self.use_ai_analysis = True
         try:
             from langchain_openai import ChatOpenAI
-            from langchain_core.messages import HumanMessage, SystemMessage
 
             self.llm = ChatOpenAI(
                 model="gpt-4o-mini",
@@ -162,7 +194,12 @@ class RiskAnalysisService:
                 "metadata": {"error": str(e)}
             }
 
-    async def _collect_market_data(self, days_back: int, analysis_type: str = "daily") -> MarketData:
+    async def _collect_market_data(
+        self,
+        days_back: int,
+        analysis_type: str = "daily",
+        use_cache: bool = True
+    ) -> MarketData:
         """장기 시장 환경 데이터 수집"""
         try:
             # 장기 분석을 위해 더 긴 기간 설정
@@ -173,56 +210,70 @@ class RiskAnalysisService:
                 # 일봉 분석: 최소 3개월 데이터
                 days_back = max(days_back, 90)
 
+            # 일봉 데이터는 짧은 시간 안에 바뀌지 않으므로 TTL 동안 재사용
+            cache_key = (days_back, analysis_type)
+            cached = self._market_data_cache.get(cache_key) if use_cache else None
+            if cached and time.monotonic() - cached[0] < self.market_data_ttl:
+                return cached[1]
+
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days_back)
 
-            # 병렬로 데이터 수집
-            tasks = []
-            for symbol_name, symbol in self.symbols.items():
-                task = self._fetch_yfinance_data(symbol, start_date, end_date)
-                tasks.append((symbol_name, task))
+            # 전체 심볼을 한 번의 다운로드로 수집
+            results = await self._fetch_yfinance_data(start_date, end_date)
 
-            # 모든 데이터 수집 완료 대기
-            results = {}
-            for symbol_name, task in tasks:
-                try:
-                    data = await task
-                    results[symbol_name] = data
-                except Exception as e:
-                    logger.warning(f"⚠️ {symbol_name} 데이터 수집 실패: {str(e)}")
-                    results[symbol_name] = None
+            # MarketData 객체 생성 (실패 시 기본값을 반환하되 캐시에는 저장하지 않음)
+            try:
+                market_data = self._create_market_data_object(results)
+            except Exception:
+                return self._default_market_data()
 
-            # MarketData 객체 생성
-            market_data = self._create_market_data_object(results)
+            # 일부 심볼이라도 수집에 실패한 결과는 캐시하지 않음 (일시적 장애가 TTL 동안 고정되는 것 방지)
+            if all(df is not None for df in results.values()):
+                self._market_data_cache[cache_key] = (time.monotonic(), market_data)
             return market_data
 
         except Exception as e:
             logger.error(f"시장 데이터 수집 실패: {str(e)}")
             raise
 
-    async def _fetch_yfinance_data(self, symbol: str, start_date: datetime, end_date: datetime) -> Optional[pd.DataFrame]:
-        """yfinance를 사용한 데이터 수집"""
+    async def _fetch_yfinance_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Optional[pd.DataFrame]]:
+        """yfinance를 사용한 데이터 수집 (전체 심볼을 한 번에 다운로드 후 심볼별로 분리)"""
+        results: Dict[str, Optional[pd.DataFrame]] = {name: None for name in self.symbols}
         if not YFINANCE_AVAILABLE:
             logger.warning(f"⚠️ yfinance가 설치되지 않음")
-            return None
+            return results
 
         try:
-            # 비동기 처리를 위해 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
+            # yf.download는 모듈 전역 상태를 공유해 동시 호출이 안전하지 않으므로
+            # 여러 호출을 병렬로 띄우지 않고 한 번의 호출로 모든 심볼을 받는다 (내부 스레드 사용)
+            tickers = list(self.symbols.values())
+            loop = asyncio.get_running_loop()
             data = await loop.run_in_executor(
                 None,
-                lambda: yf.download(symbol, start=start_date, end=end_date, progress=False)
+                lambda: yf.download(
+                    tickers, start=start_date, end=end_date,
+                    group_by="ticker", threads=True, progress=False
+                )
             )
+        except Exception as e:
+            logger.error(f"yfinance 데이터 수집 실패 ({', '.join(self.symbols.values())}): {str(e)}")
+            return results
 
-            if data.empty:
+        for symbol_name, symbol in self.symbols.items():
+            try:
+                # 거래일이 다른 심볼끼리 인덱스가 합쳐지므로 종가가 없는 행은 제거
+                frame = data[symbol].dropna(subset=['Close'])
+            except KeyError:
+                frame = None
+
+            if frame is None or frame.empty:
                 logger.warning(f"⚠️ {symbol} 데이터가 비어있음")
-                return None
+                continue
 
-            return data
+            results[symbol_name] = frame
 
-        except Exception as e:
-            logger.error(f"yfinance 데이터 수집 실패 ({symbol}): {str(e)}")
-            return None
+        return results
 
     def _create_market_data_object(self, results: Dict[str, Optional[pd.DataFrame]]) -> MarketData:
         """수집된 데이터로 MarketData 객체 생성"""
@@ -232,12 +283,15 @@ class RiskAnalysisService:
 
             for symbol_name, df in results.items():
                 if df is not None and not df.empty:
+                    # 종가 배열을 한 번만 추출해서 사용 (DataFrame 인덱싱 반복 방지)
+                    closes = np.asarray(df['Close'], dtype=np.float64).ravel()
+
                     # 최신 가격 (Close)
-                    current_price = float(df['Close'].iloc[-1])
+                    current_price = float(closes[-1])
 
                     # 24시간 변화율 (마지막 2개 데이터 포인트 기준)
-                    if len(df) >= 2:
-                        prev_price = float(df['Close'].iloc[-2])
+                    if closes.size >= 2:
+                        prev_price = float(closes[-2])
                         change_24h = ((current_price - prev_price) / prev_price) * 100
                     else:
                         change_24h = 0.0
@@ -276,14 +330,17 @@ class RiskAnalysisService:
 
         except Exception as e:
             logger.error(f"MarketData 객체 생성 실패: {str(e)}")
-            # 기본값으로 생성
-            return MarketData(
-                btc_price=0.0, btc_change_24h=0.0, btc_volatility=0.0,
-                nasdaq_price=0.0, nasdaq_change_24h=0.0,
-                dxy_price=0.0, dxy_change_24h=0.0,
-                vix_price=0.0, vix_change_24h=0.0,
-                gold_price=0.0, gold_change_24h=0.0
-            )
+            raise
+
+    def _default_market_data(self) -> MarketData:
+        """데이터 가공 실패 시 사용하는 기본 MarketData"""
+        return MarketData(
+            btc_price=0.0, btc_change_24h=0.0, btc_volatility=0.0,
+            nasdaq_price=0.0, nasdaq_change_24h=0.0,
+            dxy_price=0.0, dxy_change_24h=0.0,
+            vix_price=0.0, vix_change_24h=0.0,
+            gold_price=0.0, gold_change_24h=0.0
+        )
 
     def _calculate_volatility(self, df: Optional[pd.DataFrame]) -> float:
         """변동성 계산 (연간화된 표준편차)"""
@@ -291,11 +348,15 @@ class RiskAnalysisService:
             return 0.0
 
         try:
-            # 일일 수익률 계산
-            returns = df['Close'].pct_change().dropna()
+            # 일일 수익률 계산 (pandas 연산 대신 종가 배열에서 직접 계산)
+            closes = np.asarray(df['Close'], dtype=np.float64).ravel()
+            closes = closes[~np.isnan(closes)]
+            if closes.size < 3:
+                return 0.0
+            returns = np.diff(closes) / closes[:-1]
 
             # 연간화된 변동성 (252 거래일 기준)
-            volatility = returns.std() * np.sqrt(252) * 100
+            volatility = returns.std(ddof=1) * np.sqrt(252) * 100
             return float(volatility)
 
         except Exception as e:
@@ -508,13 +569,12 @@ class RiskAnalysisService:
             prompt = self._create_analysis_prompt(analysis_data)
 
             # AI 분석 실행
-            try:
-                from langchain_core.messages import HumanMessage, SystemMessage
+            if LANGCHAIN_MESSAGES_AVAILABLE:
                 messages = [
                     SystemMessage(content="당신은 전문적인 금융 리스크 분석가입니다. 주어진 시장 데이터를 분석하여 투자자에게 도움이 되는 인사이트를 제공해주세요."),
                     HumanMessage(content=prompt)
                 ]
-            except ImportError:
+            else:
                 # LangChain 메시지 클래스가 없는 경우 간단한 딕셔너리 사용
                 messages = [
                     {"role": "system", "content": "당신은 전문적인 금융 리스크 분석가입니다. 주어진 시장 데이터를 분석하여 투자자에게 도움이 되는 인사이트를 제공해주세요."},
@@ -542,7 +602,6 @@ class RiskAnalysisService:
 
         except Exception as e:
             logger.error(f"AI 분석 실패: {str(e)}")
-            import traceback
             logger.error(f"AI 분석 실패 상세: {traceback.format_exc()}")
             return None
 
@@ -643,49 +702,17 @@ class RiskAnalysisService:
             vix_level = risk_indicators.vix_level
             risk_off_count = len(correlation_analysis.risk_off_indicators)
 
-            # 투자 성향에 따른 임계값 조정
-            if personality == "conservative":
-                # 보수적: 더 민감하게 리스크 감지
-                critical_threshold = 70
-                high_threshold = 50
-                medium_threshold = 30
-                vix_critical = 30
-                vix_high = 20
-                vix_medium = 15
-            elif personality == "aggressive":
-                # 공격적: 덜 민감하게 리스크 감지
-                critical_threshold = 90
-                high_threshold = 70
-                medium_threshold = 50
-                vix_critical = 40
-                vix_high = 30
-                vix_medium = 25
-            else:  # neutral
-                # 중립적: 기본 임계값
-                critical_threshold = 80
-                high_threshold = 60
-                medium_threshold = 40
-                vix_critical = 35
-                vix_high = 25
-                vix_medium = 20
-
-            # 리스크 레벨 결정
-            if risk_score >= critical_threshold or vix_level >= vix_critical or risk_off_count >= 3:
-                risk_level = "CRITICAL"
-                risk_off = True
-                confidence = 0.9
-            elif risk_score >= high_threshold or vix_level >= vix_high or risk_off_count >= 2:
-                risk_level = "HIGH"
-                risk_off = True
-                confidence = 0.8
-            elif risk_score >= medium_threshold or vix_level >= vix_medium or risk_off_count >= 1:
-                risk_level = "MEDIUM"
-                risk_off = risk_off_count >= 1
-                confidence = 0.7
-            else:
-                risk_level = "LOW"
-                risk_off = False
-                confidence = 0.6
+            # 투자 성향별 임계값 테이블에서 지표마다 단계(0~3)를 구하고 가장 높은 단계를 채택
+            thresholds = RISK_LEVEL_THRESHOLDS.get(personality, RISK_LEVEL_THRESHOLDS["neutral"])
+            level = max(
+                _threshold_step(thresholds["score"], risk_score),
+                _threshold_step(thresholds["vix"], vix_level),
+                bisect_right(RISK_OFF_COUNT_THRESHOLDS, risk_off_count)
+            )
+
+            risk_level = RISK_LEVEL_LABELS[level]
+            risk_off = level >= 2 or risk_off_count >= 1
+            confidence = RISK_LEVEL_CONFIDENCE[level]
 
             return risk_level, risk_off, confidence
 
@@ -700,7 +727,8 @@ class RiskAnalysisService:
         """서비스 헬스체크"""
         try:
             # 기본 데이터 수집 테스트
-            test_data = await self._collect_market_data(7)
+            # 캐시를 거치지 않고 실제 수집 경로를 확인
+            test_data = await self._collect_market_data(7, use_cache=False)
 
             # 리스크 지표 계산 테스트
             risk_indicators = self._calculate_risk_indicators(test_data)
@@ -3,6 +3,8 @@ Autotrading V2 API 라우터
 N8n 에이전트 호환 엔드포인트 제공
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query, Body, Depends, Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
@@ -175,12 +177,12 @@ async def analyze_risk(
 async def health_check():
     """서비스 헬스체크"""
     try:
-        # 정량지표 서비스 헬스체크
-        quant_health = await quantitative_service.health_check()
-
-        # 리스크 분석 서비스 헬스체크
+        # 리스크(시장 데이터 I/O)와 정량지표(지표 계산) 헬스체크를 함께 실행
         risk_service_instance = get_risk_service()
-        risk_health = await risk_service_instance.health_check()
+        risk_health, quant_health = await asyncio.gather(
+            risk_service_instance.health_check(),
+            quantitative_service.health_check()
+        )
 
         # 통합 헬스체크 상태
         overall_status = "healthy"
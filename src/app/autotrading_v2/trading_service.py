@@ -15,8 +15,7 @@ from src.app.autotrading_v2.models import (
     TradeExecutionRequest, TradeExecutionResponse,
     TradeExecutionData, TradeExecutionDataResponse, TradeExecutionListResponse
 )
-from src.package.db import connection
-import json
+from src.package.db import connection, transaction
 
 logger = set_logger("trading_service_v2")
 
@@ -184,16 +183,8 @@ class TradingService:
     async def _execute_buy_order(self, binance_utils: BinanceUtils, request: TradeExecutionRequest) -> TradeExecutionResponse:
         """매수 주문 실행"""
         try:
-            # 직접 ccxt를 사용해서 현재 가격 조회
-            import ccxt
-            exchange = ccxt.binance({
-                'apiKey': self.api_key or '',
-                'secret': self.secret or '',
-                'sandbox': False,
-                'enableRateLimit': True,
-            })
-
-            ticker = await run_in_threadpool(exchange.fetch_ticker, request.market)
+            # 이미 생성된 바이낸스 인스턴스를 재사용해서 현재 가격 조회
+            ticker = await run_in_threadpool(binance_utils.exchange.fetch_ticker, request.market)
             current_price = float(str(ticker.get("last", 0)))
 
             if current_price <= 0:
@@ -285,16 +276,8 @@ class TradingService:
 
             # 매도할 수량 계산 (USDT 기준으로 BTC 수량 계산)
             # request.amount_quote는 USDT 금액, 이를 BTC 수량으로 변환
-            # 직접 ccxt를 사용해서 현재 가격 조회
-            import ccxt
-            exchange = ccxt.binance({
-                'apiKey': self.api_key or '',
-                'secret': self.secret or '',
-                'sandbox': False,
-                'enableRateLimit': True,
-            })
-
-            ticker = await run_in_threadpool(exchange.fetch_ticker, request.market)
+            # 이미 생성된 바이낸스 인스턴스를 재사용해서 현재 가격 조회
+            ticker = await run_in_threadpool(binance_utils.exchange.fetch_ticker, request.market)
             current_price = float(str(ticker.get("last", 0)))
 
             if current_price <= 0:
@@ -382,7 +365,8 @@ class TradingService:
             # 거래 실행 시간 파싱
             trade_timestamp = datetime.fromisoformat(result.timestamp.replace('Z', '+00:00'))
 
-            async with connection() as session:
+            # 사이클/스냅샷/거래 저장을 하나의 트랜잭션으로 묶어 커밋 1회로 처리
+            async with transaction() as session:
                 # 1. 거래 사이클 생성
                 cycle_idx = await self.trading_repository.create_trading_cycle(
                     session=session,
@@ -467,10 +451,10 @@ class TradingService:
                 # 응답 데이터 변환
                 trade_responses = []
                 for trade in trades:
-                    # JSON 데이터 파싱
-                    used_strategy_weights = json.loads(trade['used_strategy_weights']) if trade['used_strategy_weights'] else {}
-                    prime_agent_decision = json.loads(trade['prime_agent_decision']) if trade['prime_agent_decision'] else {}
-                    asset_balances = json.loads(trade['asset_balances']) if trade['asset_balances'] else {}
+                    # jsonb 컬럼은 커넥션 코덱이 dict로 디코딩
+                    used_strategy_weights = trade['used_strategy_weights'] or {}
+                    prime_agent_decision = trade['prime_agent_decision'] or {}
+                    asset_balances = trade['asset_balances'] or {}
 
                     trade_response = TradeExecutionDataResponse(
                         id=trade['trade_idx'],
@@ -547,10 +531,10 @@ class TradingService:
                 if not trade:
                     return None
 
-                # JSON 데이터 파싱
-                used_strategy_weights = json.loads(trade['used_strategy_weights']) if trade['used_strategy_weights'] else {}
-                prime_agent_decision = json.loads(trade['prime_agent_decision']) if trade['prime_agent_decision'] else {}
-                asset_balances = json.loads(trade['asset_balances']) if trade['asset_balances'] else {}
+                # jsonb 컬럼은 커넥션 코덱이 dict로 디코딩
+                used_strategy_weights = trade['used_strategy_weights'] or {}
+                prime_agent_decision = trade['prime_agent_decision'] or {}
+                asset_balances = trade['asset_balances'] or {}
 
                 return TradeExecutionDataResponse(
                     id=trade['trade_idx'],
@@ -13,12 +13,17 @@ logger = set_logger("information_router")
 - 각각의 분석 에이전트들에 대한 분석 내용 및 판단 근거 조회
 """
 
+# 상태가 없는 서비스이므로 요청마다 생성하지 않고 모듈 단위로 재사용
+_information_service = information_service.InformationService(logger)
+_user_service = user_service.UserService(logger)
+
+
 def get_information_service():
-    return information_service.InformationService(logger)
+    return _information_service
 
 
 def get_user_service():
-    return user_service.UserService(logger)
+    return _user_service
 
 
 
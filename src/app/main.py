@@ -8,11 +8,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 from src.common.utils.logger import set_logger
 from src.common.error import JSendError, ErrorCode
 from src.config.setting import settings
 from src.package.db import init_pool, release_pool
+from src.common.utils.technical_indicators_v2 import warmup_jit_kernels
 
 
 async def startup():
@@ -28,6 +30,17 @@ async def startup():
                         message : {e}
                     """)
 
+    try:
+        # 기술적 지표 JIT 커널 사전 컴파일 (첫 요청/헬스체크 지연 방지)
+        await run_in_threadpool(warmup_jit_kernels)
+        logger.info("[JIT 커널 워밍업 완료]")
+    except Exception as e:
+        logger.error(f"""
+                        [JIT 커널 워밍업 실패]
+                        error : {e.__class__.__name__}
+                        message : {e}
+                    """)
+
 async def shutdown():
     """애플리케이션 종료 시 실행"""
     try:
@@ -119,6 +132,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8080,
         reload=True,
+        loop="uvloop",
         log_level="info"
     )
 
@@ -6,9 +6,12 @@ from src.common.utils.logger import set_logger
 router = APIRouter(prefix="/users")
 logger = set_logger("users")
 
+# 상태가 없는 서비스이므로 요청마다 생성하지 않고 모듈 단위로 재사용
+_user_service = UserService(logger)
+
 # 의존성 함수 정의
 def get_user_service():
-    return UserService(logger)
+    return _user_service
 
 @router.get(
     "/ping",
@@ -35,8 +35,6 @@ class BinanceUtils:
             secret: 바이낸스 시크릿 키 (선택사항)
             testnet: 테스트넷 사용 여부 (기본값: False - 메인넷 사용)
         """
-        import os
-
         # API 키 설정 (생성자로 받은 키 사용)
         self.api_key = api_key
         self.secret = secret
@@ -6,6 +6,8 @@ inf, -inf, nan 값을 JSON 호환 값으로 변환
 import math
 from typing import Any, Dict, List, Union
 
+import orjson
+
 
 def sanitize_for_json(data: Any) -> Any:
     """
@@ -42,6 +44,10 @@ def safe_json_serialize(data: Any) -> str:
     Returns:
         JSON 문자열
     """
-    import json
     sanitized_data = sanitize_for_json(data)
-    return json.dumps(sanitized_data, ensure_ascii=False, default=str)
+    return orjson.dumps(
+        sanitized_data,
+        default=str,
+        # datetime은 기존 json.dumps와 같이 default(str)로 직렬화
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+    ).decode()
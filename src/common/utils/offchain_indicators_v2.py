@@ -18,6 +18,15 @@ from src.common.utils.logger import set_logger
 
 logger = set_logger("offchain_indicators_v2")
 
+# 소셜미디어 플랫폼별 가중치 (목록에 없는 플랫폼은 0.1)
+SOCIAL_PLATFORM_WEIGHTS = {
+    'twitter': 0.3,
+    'reddit': 0.25,
+    'telegram': 0.2,
+    'youtube': 0.15,
+    'google_trends': 0.1
+}
+
 @dataclass
 class NewsItem:
     """뉴스 아이템 데이터 클래스"""
@@ -200,22 +209,13 @@ class SocialSentimentAnalyzer:
                     "analysis": "소셜미디어 데이터 없음"
                 }
 
-            # 플랫폼별 가중치
-            platform_weights = {
-                'twitter': 0.3,
-                'reddit': 0.25,
-                'telegram': 0.2,
-                'youtube': 0.15,
-                'google_trends': 0.1
-            }
-
             weighted_sentiment = 0.0
             weighted_trend = 0.0
             total_weight = 0.0
             total_mentions = 0
 
             for item in social_data:
-                weight = platform_weights.get(item.platform, 0.1)
+                weight = SOCIAL_PLATFORM_WEIGHTS.get(item.platform, 0.1)
                 weighted_sentiment += item.sentiment_score * weight
                 weighted_trend += item.trend_score * weight
                 total_weight += weight
@@ -267,6 +267,8 @@ class MacroEconomicAnalyzer:
             'dxy': {'weight': 0.15, 'impact_threshold': 1.0},
             'unemployment': {'weight': 0.1, 'impact_threshold': 0.1}
         }
+        # 지표별 가중치만 평탄화한 조회 테이블
+        self.indicator_weights = {name: config['weight'] for name, config in self.indicators.items()}
 
     async def analyze_macro_indicators(self, macro_data: List[MacroIndicator]) -> Dict[str, Any]:
         """거시경제 지표 분석"""
@@ -283,7 +285,7 @@ class MacroEconomicAnalyzer:
             total_weight = 0.0
 
             for item in macro_data:
-                weight = self.indicators.get(item.indicator, {}).get('weight', 0.1)
+                weight = self.indicator_weights.get(item.indicator, 0.1)
                 impact = item.impact_score * weight
                 weighted_impact += impact
                 total_weight += weight
@@ -15,6 +15,13 @@ from src.common.utils.logger import set_logger
 
 logger = set_logger("real_data_sources")
 
+# FRED API 키가 없거나 실패했을 때 사용하는 모의 경제 지표
+MOCK_ECONOMIC_DATA = {
+    'cpi': {'value': 3.2, 'date': '2024-01-01', 'series_id': 'CPIAUCSL'},
+    'ppi': {'value': 2.8, 'date': '2024-01-01', 'series_id': 'PPIACO'},
+    'unemployment': {'value': 3.8, 'date': '2024-01-01', 'series_id': 'UNRATE'}
+}
+
 @dataclass
 class APIKey:
     """API 키 관리"""
@@ -72,18 +79,19 @@ class NewsAPIClient:
 
     def _get_mock_news(self) -> List[Dict[str, Any]]:
         """모의 뉴스 데이터"""
+        now = datetime.now()
         return [
             {
                 "title": "Bitcoin ETF Approval Expected This Week",
                 "source": {"name": "Reuters"},
-                "publishedAt": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "publishedAt": (now - timedelta(hours=2)).isoformat(),
                 "url": "https://reuters.com/bitcoin-etf",
                 "description": "Major Bitcoin ETF approval expected this week..."
             },
             {
                 "title": "Crypto Regulation Concerns Rise in Europe",
                 "source": {"name": "Bloomberg"},
-                "publishedAt": (datetime.now() - timedelta(hours=4)).isoformat(),
+                "publishedAt": (now - timedelta(hours=4)).isoformat(),
                 "url": "https://bloomberg.com/crypto-regulation",
                 "description": "European regulators express concerns about crypto..."
             }
@@ -138,11 +146,12 @@ class TwitterAPIClient:
 
     def _get_mock_tweets(self) -> List[Dict[str, Any]]:
         """모의 트윗 데이터"""
+        now = datetime.now()
         return [
             {
                 "id": "1234567890",
                 "text": "Bitcoin is looking strong today! 🚀",
-                "created_at": (datetime.now() - timedelta(hours=1)).isoformat(),
+                "created_at": (now - timedelta(hours=1)).isoformat(),
                 "public_metrics": {
                     "retweet_count": 50,
                     "like_count": 200,
@@ -152,7 +161,7 @@ class TwitterAPIClient:
             {
                 "id": "1234567891",
                 "text": "Crypto market is volatile but I'm bullish long-term",
-                "created_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "created_at": (now - timedelta(hours=2)).isoformat(),
                 "public_metrics": {
                     "retweet_count": 25,
                     "like_count": 100,
@@ -184,19 +193,18 @@ class FREDAPIClient:
                 logger.warning("FRED API 키가 설정되지 않음. 모의 데이터 사용")
                 return self._get_mock_economic_data()
 
-            indicators = {}
-
-            # CPI 데이터
-            cpi_data = await self._get_series_data('CPIAUCSL')
-            indicators['cpi'] = cpi_data
-
-            # PPI 데이터
-            ppi_data = await self._get_series_data('PPIACO')
-            indicators['ppi'] = ppi_data
-
-            # 실업률 데이터
-            unemployment_data = await self._get_series_data('UNRATE')
-            indicators['unemployment'] = unemployment_data
+            # CPI / PPI / 실업률 시리즈를 동시에 조회
+            cpi_data, ppi_data, unemployment_data = await asyncio.gather(
+                self._get_series_data('CPIAUCSL'),
+                self._get_series_data('PPIACO'),
+                self._get_series_data('UNRATE')
+            )
+
+            indicators = {
+                'cpi': cpi_data,
+                'ppi': ppi_data,
+                'unemployment': unemployment_data
+            }
 
             return indicators
 
@@ -229,12 +237,8 @@ class FREDAPIClient:
             return {'value': 0, 'date': '', 'series_id': series_id}
 
     def _get_mock_economic_data(self) -> Dict[str, Any]:
-        """모의 경제 데이터"""
-        return {
-            'cpi': {'value': 3.2, 'date': '2024-01-01', 'series_id': 'CPIAUCSL'},
-            'ppi': {'value': 2.8, 'date': '2024-01-01', 'series_id': 'PPIACO'},
-            'unemployment': {'value': 3.8, 'date': '2024-01-01', 'series_id': 'UNRATE'}
-        }
+        """모의 경제 데이터 (호출자가 수정해도 상수가 바뀌지 않도록 지표별 복사본 반환)"""
+        return {key: dict(value) for key, value in MOCK_ECONOMIC_DATA.items()}
 
 class RealDataCollector:
     """실제 데이터 수집기"""
@@ -247,17 +251,22 @@ class RealDataCollector:
         try:
             logger.info("🔍 [실제 데이터] 수집 시작")
 
-            # 뉴스 데이터
-            async with NewsAPIClient(self.api_keys.news_api) as news_client:
-                news_data = await news_client.get_crypto_news()
+            async def collect_news():
+                async with NewsAPIClient(self.api_keys.news_api) as news_client:
+                    return await news_client.get_crypto_news()
+
+            async def collect_tweets():
+                async with TwitterAPIClient(self.api_keys.twitter_bearer) as twitter_client:
+                    return await twitter_client.get_crypto_tweets()
 
-            # 트위터 데이터
-            async with TwitterAPIClient(self.api_keys.twitter_bearer) as twitter_client:
-                twitter_data = await twitter_client.get_crypto_tweets()
+            async def collect_economic():
+                async with FREDAPIClient(self.api_keys.fred_api) as fred_client:
+                    return await fred_client.get_economic_indicators()
 
-            # 경제 지표 데이터
-            async with FREDAPIClient(self.api_keys.fred_api) as fred_client:
-                economic_data = await fred_client.get_economic_indicators()
+            # 뉴스/트위터/경제 지표는 서로 독립적인 I/O이므로 동시에 수집
+            news_data, twitter_data, economic_data = await asyncio.gather(
+                collect_news(), collect_tweets(), collect_economic()
+            )
 
             logger.info("✅ [실제 데이터] 수집 완료")
 
@@ -13,6 +13,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 from dataclasses import dataclass
+from fastapi.concurrency import run_in_threadpool
 
 from src.common.utils.logger import set_logger
 
@@ -40,6 +41,22 @@ except ImportError:
     TEXTBLOB_AVAILABLE = False
     logger.warning("textblob 라이브러리가 설치되지 않음. 센티멘트 분석 기능이 제한됩니다.")
 
+# 키워드 기반 센티멘트 분석용 키워드 (호출마다 리스트를 새로 만들지 않도록 모듈 상수로 유지)
+POSITIVE_KEYWORDS = ('good', 'great', 'excellent', 'amazing', 'bullish', 'moon', 'pump', 'buy', 'hodl')
+NEGATIVE_KEYWORDS = ('bad', 'terrible', 'awful', 'bearish', 'dump', 'sell', 'crash', 'fear')
+
+
+def _simple_sentiment_analysis(text: str) -> float:
+    """간단한 키워드 기반 센티멘트 분석 (Reddit/Twitter 수집기 공용)"""
+    text_lower = text.lower()
+    positive_count = sum(1 for word in POSITIVE_KEYWORDS if word in text_lower)
+    negative_count = sum(1 for word in NEGATIVE_KEYWORDS if word in text_lower)
+
+    if positive_count + negative_count == 0:
+        return 0.0
+
+    return (positive_count - negative_count) / (positive_count + negative_count)
+
 @dataclass
 class RedditPost:
     """Reddit 포스트 데이터 클래스"""
@@ -85,6 +102,9 @@ class RedditDataCollector:
         - Reddit API 앱 등록 후 client_id, client_secret 필요
         - user_agent: "YourApp/1.0 by YourUsername"
         """
+        # praw.Reddit는 스레드 안전하지 않으므로 스레드풀 호출을 한 번에 하나씩만 실행
+        self._reddit_lock = asyncio.Lock()
+
         if not PRAW_AVAILABLE:
             logger.error("praw 라이브러리가 설치되지 않음. Reddit 기능을 사용할 수 없습니다.")
             self.reddit = None
@@ -117,38 +137,50 @@ class RedditDataCollector:
                 logger.warning("Reddit API가 초기화되지 않음")
                 return []
 
-            posts = []
-            total_collected = 0
-
-            for subreddit_name in self.crypto_subreddits:
-                if total_collected >= limit:
-                    break
+            def to_post(submission, subreddit_name: str) -> RedditPost:
+                return RedditPost(
+                    title=submission.title,
+                    content=submission.selftext or "",
+                    subreddit=subreddit_name,
+                    score=submission.score,
+                    upvote_ratio=submission.upvote_ratio,
+                    num_comments=submission.num_comments,
+                    created_utc=datetime.fromtimestamp(submission.created_utc),
+                    url=f"https://reddit.com{submission.permalink}",
+                    author=str(submission.author) if submission.author else "deleted"
+                )
 
+            def fetch_hot_posts() -> List[RedditPost]:
+                # 서브레딧별 개별 요청 대신 멀티레딧 하나로 hot 포스트를 조회
                 try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-
-                    # Hot 포스트 수집
-                    for submission in subreddit.hot(limit=min(20, limit - total_collected)):
-                        if total_collected >= limit:
-                            break
-
-                        post = RedditPost(
-                            title=submission.title,
-                            content=submission.selftext or "",
-                            subreddit=subreddit_name,
-                            score=submission.score,
-                            upvote_ratio=submission.upvote_ratio,
-                            num_comments=submission.num_comments,
-                            created_utc=datetime.fromtimestamp(submission.created_utc),
-                            url=f"https://reddit.com{submission.permalink}",
-                            author=str(submission.author) if submission.author else "deleted"
-                        )
-                        posts.append(post)
-                        total_collected += 1
-
+                    multireddit = self.reddit.subreddit("+".join(self.crypto_subreddits))
+                    return [
+                        to_post(submission, submission.subreddit.display_name)
+                        for submission in multireddit.hot(limit=limit)
+                    ]
                 except Exception as e:
-                    logger.warning(f"Subreddit {subreddit_name} 수집 실패: {str(e)}")
-                    continue
+                    # 비공개/차단/이름 변경된 서브레딧이 하나라도 있으면 멀티레딧 전체가 실패하므로 개별 조회로 대체
+                    logger.warning(f"멀티레딧 조회 실패, 서브레딧별 조회로 대체: {str(e)}")
+
+                posts = []
+                for subreddit_name in self.crypto_subreddits:
+                    if len(posts) >= limit:
+                        break
+
+                    try:
+                        subreddit = self.reddit.subreddit(subreddit_name)
+                        for submission in subreddit.hot(limit=min(20, limit - len(posts))):
+                            posts.append(to_post(submission, subreddit_name))
+                    except Exception as e:
+                        logger.warning(f"Subreddit {subreddit_name} 수집 실패: {str(e)}")
+                        continue
+
+                return posts
+
+            # praw는 동기 HTTP이므로 스레드풀에서 실행
+            # (서비스 인스턴스를 요청 간에 공유하므로 동시 요청이 같은 클라이언트를 여러 스레드에서 쓰지 않도록 직렬화)
+            async with self._reddit_lock:
+                posts = await run_in_threadpool(fetch_hot_posts)
 
             logger.info(f"✅ Reddit 포스트 {len(posts)}개 수집 완료")
             return posts
@@ -192,7 +224,7 @@ class RedditDataCollector:
                 sentiment = blob.sentiment.polarity
             else:
                 # TextBlob이 없을 경우 간단한 키워드 기반 분석
-                sentiment = self._simple_sentiment_analysis(text)
+                sentiment = _simple_sentiment_analysis(text)
 
             # 업보트 비율로 센티멘트 보정
             upvote_adjustment = (post.upvote_ratio - 0.5) * 0.3
@@ -205,20 +237,6 @@ class RedditDataCollector:
             logger.error(f"Reddit 센티멘트 분석 실패: {str(e)}")
             return 0.0
 
-    def _simple_sentiment_analysis(self, text: str) -> float:
-        """간단한 키워드 기반 센티멘트 분석"""
-        positive_keywords = ['good', 'great', 'excellent', 'amazing', 'bullish', 'moon', 'pump', 'buy', 'hodl']
-        negative_keywords = ['bad', 'terrible', 'awful', 'bearish', 'dump', 'sell', 'crash', 'fear']
-
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
-
-        if positive_count + negative_count == 0:
-            return 0.0
-
-        return (positive_count - negative_count) / (positive_count + negative_count)
-
 class TwitterDataCollector:
     """Twitter 데이터 수집기"""
 
@@ -227,6 +245,9 @@ class TwitterDataCollector:
         Twitter API v2 초기화
         - Bearer Token 필요 (Academic Research access 권장)
         """
+        # tweepy.Client는 하나의 requests 세션을 공유하므로 스레드풀 호출을 한 번에 하나씩만 실행
+        self._client_lock = asyncio.Lock()
+
         if not TWEEPY_AVAILABLE:
             logger.error("tweepy 라이브러리가 설치되지 않음. Twitter 기능을 사용할 수 없습니다.")
             self.client = None
@@ -261,14 +282,16 @@ class TwitterDataCollector:
             start_time = datetime.utcnow() - timedelta(hours=hours_back)
 
             try:
-                # Twitter API v2로 트윗 검색
-                response = self.client.search_recent_tweets(
-                    query=query,
-                    max_results=min(max_results, 100),  # API 제한
-                    tweet_fields=['created_at', 'public_metrics', 'author_id'],
-                    user_fields=['username'],
-                    start_time=start_time
-                )
+                # Twitter API v2로 트윗 검색 (tweepy는 동기 HTTP이므로 스레드풀에서 실행)
+                async with self._client_lock:
+                    response = await run_in_threadpool(
+                        self.client.search_recent_tweets,
+                        query=query,
+                        max_results=min(max_results, 100),  # API 제한
+                        tweet_fields=['created_at', 'public_metrics', 'author_id'],
+                        user_fields=['username'],
+                        start_time=start_time
+                    )
 
                 if response.data:
                     for tweet in response.data:
@@ -357,7 +380,7 @@ class TwitterDataCollector:
                 sentiment = blob.sentiment.polarity
             else:
                 # TextBlob이 없을 경우 간단한 키워드 기반 분석
-                sentiment = self._simple_sentiment_analysis(tweet.text)
+                sentiment = _simple_sentiment_analysis(tweet.text)
 
             # 참여도로 센티멘트 보정
             engagement_score = self.calculate_twitter_engagement_score(tweet)
@@ -371,20 +394,6 @@ class TwitterDataCollector:
             logger.error(f"Twitter 센티멘트 분석 실패: {str(e)}")
             return 0.0
 
-    def _simple_sentiment_analysis(self, text: str) -> float:
-        """간단한 키워드 기반 센티멘트 분석"""
-        positive_keywords = ['good', 'great', 'excellent', 'amazing', 'bullish', 'moon', 'pump', 'buy', 'hodl']
-        negative_keywords = ['bad', 'terrible', 'awful', 'bearish', 'dump', 'sell', 'crash', 'fear']
-
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
-
-        if positive_count + negative_count == 0:
-            return 0.0
-
-        return (positive_count - negative_count) / (positive_count + negative_count)
-
 class SocialDataAggregator:
     """소셜미디어 데이터 통합 분석기"""
 
@@ -421,17 +430,16 @@ class SocialDataAggregator:
     ) -> List[SocialMention]:
         """소셜미디어 멘션 통합 수집"""
         try:
-            mentions = []
-
-            # Reddit 데이터 수집
-            if self.reddit_collector:
+            async def collect_reddit() -> List[SocialMention]:
+                if not self.reddit_collector:
+                    return []
                 try:
                     reddit_posts = await self.reddit_collector.collect_crypto_posts(
                         limit=reddit_limit
                     )
 
-                    for post in reddit_posts:
-                        mention = SocialMention(
+                    return [
+                        SocialMention(
                             platform="reddit",
                             content=f"{post.title} {post.content}".strip(),
                             author=post.author,
@@ -440,20 +448,23 @@ class SocialDataAggregator:
                             timestamp=post.created_utc,
                             url=post.url
                         )
-                        mentions.append(mention)
+                        for post in reddit_posts
+                    ]
                 except Exception as e:
                     logger.warning(f"Reddit 데이터 수집 실패: {str(e)}")
+                    return []
 
-            # Twitter 데이터 수집
-            if self.twitter_collector:
+            async def collect_twitter() -> List[SocialMention]:
+                if not self.twitter_collector:
+                    return []
                 try:
                     twitter_tweets = await self.twitter_collector.collect_crypto_tweets(
                         max_results=twitter_limit,
                         hours_back=hours_back
                     )
 
-                    for tweet in twitter_tweets:
-                        mention = SocialMention(
+                    return [
+                        SocialMention(
                             platform="twitter",
                             content=tweet.text,
                             author=tweet.author,
@@ -462,9 +473,17 @@ class SocialDataAggregator:
                             timestamp=tweet.created_at,
                             url=f"https://twitter.com/user/status/{tweet.tweet_id}"
                         )
-                        mentions.append(mention)
+                        for tweet in twitter_tweets
+                    ]
                 except Exception as e:
                     logger.warning(f"Twitter 데이터 수집 실패: {str(e)}")
+                    return []
+
+            # Reddit/Twitter 수집은 서로 독립적인 I/O이므로 동시에 실행
+            reddit_mentions, twitter_mentions = await asyncio.gather(
+                collect_reddit(), collect_twitter()
+            )
+            mentions = reddit_mentions + twitter_mentions
 
             # API 키가 없거나 실패한 경우 모의 데이터 생성
             if not mentions:
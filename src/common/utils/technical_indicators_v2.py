@@ -15,6 +15,68 @@ from src.common.utils.logger import set_logger
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
 logger = set_logger("technical_indicators_v2")
+
+# 선택적 import (numba가 없으면 순수 파이썬 루프로 동작)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과시키는 대체 구현"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _exponential_smoothing_loop(data: np.ndarray, alpha: float) -> np.ndarray:
+    """지수 평활 재귀 루프 (EMA, Wilder's smoothing 공통)"""
+    smoothed = np.zeros_like(data)
+    smoothed[0] = data[0]
+    for i in range(1, len(data)):
+        smoothed[i] = alpha * data[i] + (1 - alpha) * smoothed[i-1]
+    return smoothed
+
+
+@njit(cache=True)
+def _obv_loop(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """OBV 누적 루프"""
+    obv = np.zeros_like(close)
+    obv[0] = volume[0]
+    for i in range(1, len(close)):
+        if close[i] > close[i-1]:
+            obv[i] = obv[i-1] + volume[i]
+        elif close[i] < close[i-1]:
+            obv[i] = obv[i-1] - volume[i]
+        else:
+            obv[i] = obv[i-1]
+    return obv
+
+
+@njit(cache=True)
+def _macd_cross_loop(macd: np.ndarray, signal: np.ndarray) -> np.ndarray:
+    """MACD 크로스오버 판정 루프"""
+    cross = np.zeros_like(macd)
+    for i in range(1, len(macd)):
+        if macd[i-1] <= signal[i-1] and macd[i] > signal[i]:
+            cross[i] = 1  # 골든크로스
+        elif macd[i-1] >= signal[i-1] and macd[i] < signal[i]:
+            cross[i] = -1  # 데드크로스
+    return cross
+
+
+def warmup_jit_kernels() -> None:
+    """JIT 커널 사전 컴파일 (첫 요청이 이벤트 루프에서 컴파일하지 않도록 시작 시 1회 호출)"""
+    if not NUMBA_AVAILABLE:
+        return
+    sample = np.linspace(1.0, 2.0, 8)
+    _exponential_smoothing_loop(sample, 0.5)
+    _obv_loop(sample, sample)
+    _macd_cross_loop(sample, sample[::-1].copy())
+
+
 class TechnicalIndicatorsV2:
     """TA-Lib 기반 기술적 지표 계산 클래스 V2"""
 
@@ -255,15 +317,9 @@ class TechnicalIndicatorsV2:
 
     def _detect_macd_cross(self, macd: np.ndarray, signal: np.ndarray) -> np.ndarray:
         """MACD 크로스오버 신호 감지"""
-        cross = np.zeros_like(macd)
-
-        for i in range(1, len(macd)):
-            if (macd[i-1] <= signal[i-1] and macd[i] > signal[i]):
-                cross[i] = 1  # 골든크로스
-            elif (macd[i-1] >= signal[i-1] and macd[i] < signal[i]):
-                cross[i] = -1  # 데드크로스
-
-        return cross
+        return _macd_cross_loop(
+            np.asarray(macd, dtype=np.float64), np.asarray(signal, dtype=np.float64)
+        )
 
     def _calculate_momentum_metrics(self, close: np.ndarray, config: Dict[str, Any]) -> Dict[str, Any]:
         """모멘텀 메트릭 계산"""
@@ -366,13 +422,7 @@ class TechnicalIndicatorsV2:
     def _calculate_ema(self, prices: np.ndarray, period: int) -> np.ndarray:
         """EMA 직접 구현"""
         alpha = 2.0 / (period + 1)
-        ema = np.zeros_like(prices)
-        ema[0] = prices[0]
-
-        for i in range(1, len(prices)):
-            ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
-
-        return ema
+        return _exponential_smoothing_loop(np.asarray(prices, dtype=np.float64), alpha)
 
     def _calculate_macd(self, close: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """MACD 직접 구현"""
@@ -471,15 +521,8 @@ class TechnicalIndicatorsV2:
         if len(data) == 0:
             return np.array([])
 
-        smoothed = np.zeros_like(data)
-        smoothed[0] = data[0]
-
         alpha = 1.0 / period
-
-        for i in range(1, len(data)):
-            smoothed[i] = alpha * data[i] + (1 - alpha) * smoothed[i-1]
-
-        return smoothed
+        return _exponential_smoothing_loop(np.asarray(data, dtype=np.float64), alpha)
 
     def _calculate_bollinger_bands(self, close: np.ndarray, period: int, std_dev: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Bollinger Bands 직접 구현"""
@@ -513,18 +556,7 @@ class TechnicalIndicatorsV2:
 
     def _calculate_obv(self, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
         """OBV 직접 구현"""
-        obv = np.zeros_like(close)
-        obv[0] = volume[0]
-
-        for i in range(1, len(close)):
-            if close[i] > close[i-1]:
-                obv[i] = obv[i-1] + volume[i]
-            elif close[i] < close[i-1]:
-                obv[i] = obv[i-1] - volume[i]
-            else:
-                obv[i] = obv[i-1]
-
-        return obv
+        return _obv_loop(np.asarray(close, dtype=np.float64), np.asarray(volume, dtype=np.float64))
 
     def _calculate_ad(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
         """AD (Accumulation/Distribution) 직접 구현"""
@@ -1,26 +1,53 @@
 from contextlib import asynccontextmanager
 from typing import Dict
 
-from asyncpg import create_pool
+import orjson
+from asyncpg import Connection, create_pool
 from asyncpg.pool import Pool
 
 from src.config.setting import settings
 
 
+async def _init_connection(conn: Connection) -> None:
+    """json/jsonb 컬럼을 orjson으로 직접 인코딩/디코딩하도록 코덱을 등록합니다."""
+    for typename in ("jsonb", "json"):
+        await conn.set_type_codec(
+            typename,
+            # 기존 json.dumps처럼 int 키와 numpy 스칼라도 허용
+            encoder=lambda value: orjson.dumps(
+                value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
+
 class PoolCreate:
     """Connection Pool을 사용한 방식입니다."""
     def __init__(self, databases: Dict):
         self.databases = databases["DATABASE"]
         self.default = databases["default"]
 
-    async def init(self) -> None:
+    async def init(
+        self,
+        min_size: int = 4,
+        max_size: int = 20,
+        max_inactive_connection_lifetime: float = 300,
+        statement_cache_size: int = 512,
+    ) -> None:
         for key, value in self.databases.items():
+            # 프로세스 전체에서 재사용하는 풀 (연결 핸드셰이크/prepared statement 재사용)
             self.databases[key] = await create_pool(
                 host=value["DB_HOST"],
                 port=value["DB_PORT"],
                 database=value["DB_NAME"],
                 user=value["DB_USER"],
                 password=value["DB_PASSWORD"],
+                min_size=min_size,
+                max_size=max_size,
+                max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+                statement_cache_size=statement_cache_size,
+                init=_init_connection,
             )
 
     async def release(self) -> None:
@@ -1,8 +1,8 @@
-import json
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
+import orjson
 from redis.asyncio import ConnectionPool, Redis
 
 from src.common.conf import setting
@@ -19,16 +19,19 @@ class RedisPool:
         self,
         redis_settings
     ):
-        self.redis_settings = json.loads(redis_settings)
+        self.redis_settings = orjson.loads(redis_settings)
         self.pools: Dict[int, ConnectionPool | None] = {}
+        self.idle_timeout = 600
         self.last_used = {}  # 마지막 사용 시간 추적
         self.connection_ids = {}  # 각 db의 연결 ID 추적
 
     async def init(
         self,
         max_pool_size: int,
-        idle_timeout: int = 600  # 10분
+        idle_timeout: int = 600,  # 10분
+        socket_timeout: int = 10,
     ):
+        self.idle_timeout = idle_timeout
         database = self.redis_settings['databases'][setting.REDIS_DB]
         connection_id = str(uuid.uuid4())[:8]  # 8자리 고유 ID 생성
         self.connection_ids[database] = connection_id
@@ -39,8 +42,9 @@ class RedisPool:
             db=database,
             password=self.redis_settings['password'],
             max_connections=max_pool_size,
+            # 클라이언트 공통 옵션은 풀에서 한 번만 설정 (호출부에서 재지정하지 않음)
             decode_responses=True,
-            socket_timeout=idle_timeout,
+            socket_timeout=socket_timeout,
             socket_connect_timeout=30,
             retry_on_timeout=True,
             health_check_interval=30
@@ -62,12 +66,12 @@ class RedisPool:
     async def cleanup_idle(self):
         current_time = datetime.now()
         for db, pool in self.pools.items():
-            if pool and (current_time - self.last_used.get(db, current_time)).seconds > 600:
+            if pool and (current_time - self.last_used.get(db, current_time)).seconds > self.idle_timeout:
                 try:
                     connection_id = self.connection_ids.get(db, "unknown")
-                    await pool.aclose()
-                    self.pools[db] = None
-                    LOGGER.info(f"Redis connection closed due to idle - ID: {connection_id}, DB: {db}, Idle time: {(current_time - self.last_used[db]).seconds}s")
+                    # 풀 객체는 유지하고 유휴 소켓만 정리 (다음 요청에서 풀 재생성 없이 재사용)
+                    await pool.disconnect(inuse_connections=False)
+                    LOGGER.info(f"Redis idle connections disconnected - ID: {connection_id}, DB: {db}, Idle time: {(current_time - self.last_used[db]).seconds}s")
                 except Exception as e:
                     LOGGER.error(f"Failed to close Redis connection - ID: {connection_id}, DB: {db}, Error: {str(e)}")
 
@@ -116,7 +120,7 @@ async def release_pool():
 
 async def get_all_keys(db: int) -> List[str]:
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.keys()
 
 
@@ -125,13 +129,13 @@ async def get_all_value(
     json_loads: bool = True
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         key_value_list: List[Tuple] = []
         async for key in redis_conn.scan_iter(match="*"):
             value = await redis_conn.get(key)
             if json_loads:
                 try:
-                    key_value_list.append((key, json.loads(value)))
+                    key_value_list.append((key, orjson.loads(value)))
                 except Exception as e:
                     key_value_list.append((key, value))
             else:
@@ -166,14 +170,19 @@ async def set_value(
     # JSON 직렬화
     try:
         if isinstance(value, (dict, list)):
-            value = json.dumps(value, default=lambda o: dict(o.__dict__) if hasattr(o, '__dict__') else str(o))
+            value = orjson.dumps(
+                value,
+                default=lambda o: dict(o.__dict__) if hasattr(o, '__dict__') else str(o),
+                # datetime은 기존 json.dumps와 같이 default(str)로 넘겨 'YYYY-MM-DD HH:MM:SS' 형식 유지
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
     except TypeError as e:
         LOGGER.error(f"JSON serialization error: {str(e)}, value type: {type(value)}")
         # 직렬화 실패시 문자열로 변환
         value = str(value)
 
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True, socket_timeout=10) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         if expire_time > 0:
             await redis_conn.setex(key, expire_time, value)
         else:
@@ -187,7 +196,7 @@ async def get_value(
     key: str = "",
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True, socket_timeout=10) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         value = await redis_conn.get(key)
         if value:
             try:
@@ -200,7 +209,7 @@ async def get_value(
                         (stripped.startswith('[') and stripped.endswith(']'))
                     ):
                         # return json.loads(value)
-                        value_dict = json.loads(value)
+                        value_dict = orjson.loads(value)
                         for key, val in value_dict.items():
                             if isinstance(val, str) and val.startswith('<Record'):
                                 # Record 문자열을 딕셔너리로 파싱
@@ -214,8 +223,8 @@ async def get_value(
                                         record_dict[k] = v
                                 value_dict[key] = record_dict
                         return value_dict
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return value
             except Exception as e:
                 LOGGER.error(f"Error parsing Redis value: {str(e)}")
@@ -267,7 +276,7 @@ async def set_ttl(
     expire_time: int = 0
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         await redis_conn.expire(key, expire_time)  # expire_time을 설정
 
 
@@ -279,7 +288,7 @@ async def hset_value(
     # data_type: str = Constants.Meta.DataType.STRING,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.hset(key, field, value)
 
 
@@ -290,7 +299,7 @@ async def hget_value(
     # data_type: str = Constants.Meta.DataType.STRING,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.hget(key, field)
 
 
@@ -300,7 +309,7 @@ async def hget_all(
     data_type: str = Constant.DataType.STRING,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         res = await redis_conn.hgetall(key)
 
         if data_type == Constant.DataType.INT:
@@ -312,7 +321,7 @@ async def hget_all(
             # res = {k: json.loads(v) for k, v in res.items()}
             # 안전한 json 파싱 처리
             res = {
-                k: json.loads(v) if isinstance(v, (str, bytes)) else v
+                k: orjson.loads(v) if isinstance(v, (str, bytes)) else v
                 for k, v in res.items()
             }
         # return await redis_conn.hgetall(key)
@@ -325,7 +334,7 @@ async def lpush_value(
     value: Any = None,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.lpush(key, value)
 
 
@@ -336,7 +345,7 @@ async def lset_value(
     value: Any = None,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.lset(key, index, value)
 
 
@@ -347,7 +356,7 @@ async def lrem_value(
     value: Any = None,
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.lrem(key, count, value)
 
 async def rpop_value(
@@ -365,7 +374,7 @@ async def rpop_value(
         Any: 리스트의 마지막 요소. 리스트가 비어있으면 None 반환
     """
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.rpop(key)
 
 
@@ -392,7 +401,7 @@ async def delete_by_key(
     key: str = ""
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.delete(key)
 
 
@@ -402,18 +411,46 @@ async def delete_value_specific_field(
     field: str = "",
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         if field:  # 특정 필드가 주어지면 해당 필드만 삭제
             return await redis_conn.hdel(key, field)  # 해시에서 특정 필드 삭제
         return await redis_conn.delete(key)  # 키 전체 삭제
 
 
+async def delete_fields_bulk(
+    db: int = setting.REDIS_DB,
+    items: List[Tuple[str, str | None]] | None = None,
+):
+    """
+    여러 키/필드 삭제를 파이프라인으로 묶어 한 번의 왕복으로 처리합니다.
+
+    Args:
+        db (int): Redis 데이터베이스 번호
+        items (List[Tuple[str, str | None]] | None): (키, 필드) 목록. 필드가 없으면 키 전체 삭제
+
+    Returns:
+        List[int]: 각 삭제 명령의 결과
+    """
+    if not items:
+        return []
+
+    pool = await redis_pool.get(db=db)
+    async with Redis(connection_pool=pool) as redis_conn:
+        async with redis_conn.pipeline(transaction=False) as pipe:
+            for key, field in items:
+                if field:
+                    pipe.hdel(key, field)
+                else:
+                    pipe.delete(key)
+            return await pipe.execute()
+
+
 async def get_type(
     db: int = setting.REDIS_DB,
     key: str = ""
 ):
     pool = await redis_pool.get(db=db)
-    async with Redis(connection_pool=pool, decode_responses=True) as redis_conn:
+    async with Redis(connection_pool=pool) as redis_conn:
         return await redis_conn.type(key)
 
 
@@ -1,8 +1,12 @@
+import itertools
 import time
 from typing import Dict, List
 
 from pydantic import BaseModel
 
+# 버튼 기본 ID 생성기 (프로세스 시작 시각으로 한 번만 시드)
+_BTN_COUNTER = itertools.count(int(time.time() * 1000))
+
 
 class BlocksModel(BaseModel):
     pass
@@ -70,7 +74,7 @@ class Button(BlocksModel):
 
     @property
     def element(self) -> Dict:
-        random_id: str = str(time.time()).replace('.', '')
+        random_id: str = str(next(_BTN_COUNTER))
         return {
             "type": "button",
             "text": {